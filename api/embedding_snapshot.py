@@ -0,0 +1,348 @@
+import os
+import re
+import json
+import shutil
+import logging
+import numpy as np
+from datetime import datetime
+from pymilvus import Collection, utility
+from tqdm import trange
+from core.messages import ServerMessages
+from services.text_embedding import TextEmbeddings
+
+logger = logging.getLogger("uvicorn.error")
+
+VERSION_PATTERN = re.compile(r"^\d{14}$")
+COLLECTION_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class EmbeddingSnapshot:
+    """Milvus 컬렉션의 id 및 임베딩 벡터를 디스크 스냅샷으로 내보내고 복원하는 클래스입니다.
+
+    스냅샷은 `{path}/{모델}/{컬렉션}/{버전}/` 디렉토리에 아래 파일로 저장됩니다.
+    임베딩 모델별로 구분되므로 같은 모델을 사용하는 환경에서는 재임베딩 없이 복원할 수 있습니다.
+
+    - ids.npy: int64 id 배열
+    - embeddings.npy: float32 임베딩 행렬 (memory-map으로 읽기 가능)
+    - texts.json: 임베딩 원문 텍스트 목록
+    - manifest.json: 컬렉션, 모델, 건수, 차원 등 메타 정보
+
+    Attributes:
+        text_embedding (TextEmbeddings): 임베딩 모델 정보 조회용 객체.
+        initialize_db (InitializeDB): Milvus 컬렉션 생성을 위한 초기화 객체.
+        config (AppConfig): 전체 애플리케이션 설정 객체.
+        embedding_config (EmbeddingConfig): 임베딩 서버 설정 객체.
+        snapshot_config (SnapshotConfig): 스냅샷 설정 객체.
+    """
+
+    def __init__(self, config, initialize_db):
+        """EmbeddingSnapshot 클래스 초기화
+
+        Args:
+            config (AppConfig): 앱 설정 객체.
+            initialize_db (InitializeDB): DB 연결 및 초기화 객체.
+        """
+        self.text_embedding = TextEmbeddings()
+
+        self.initialize_db = initialize_db
+        self.config = config
+        self.embedding_config = config.embedding
+        self.snapshot_config = config.snapshot
+
+    def _model_id(self):
+        """스냅샷 버전 구분에 사용할 임베딩 모델 이름을 반환합니다.
+
+        Returns:
+            str: 임베딩 모델 이름.
+        """
+        model = self.embedding_config.model or self.text_embedding.get_model_id()
+        if not model:
+            raise ValueError(ServerMessages.EMBEDDING_MODEL_ERROR)
+        return model
+
+    def _collection_dir(self, model: str, col: str):
+        """모델 및 컬렉션별 스냅샷 디렉토리 경로를 반환합니다.
+
+        Args:
+            model (str): 임베딩 모델 이름.
+            col (str): 컬렉션 이름.
+
+        Returns:
+            str: 스냅샷 디렉토리 경로.
+
+        Raises:
+            ValueError: 컬렉션 이름이 Milvus 이름 규칙에 맞지 않는 경우.
+        """
+        if not COLLECTION_PATTERN.match(col):
+            raise ValueError(ServerMessages.SNAPSHOT_COLLECTION_ERROR + f"{col}")
+        return os.path.join(self.snapshot_config.path, model.replace("/", "__"), col)
+
+    def get_latest_snapshot(self, col: str, version: str = None):
+        """현재 임베딩 모델 기준으로 컬렉션의 스냅샷 경로를 찾습니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+            version (str, optional): 스냅샷 버전. None이면 가장 최근 버전.
+
+        Returns:
+            str or None: 스냅샷 디렉토리 경로, 없으면 None.
+
+        Raises:
+            ValueError: 버전이 `YYYYMMDDHHMMSS` 형식이 아닌 경우.
+        """
+        if version is not None and not VERSION_PATTERN.match(version):
+            raise ValueError(ServerMessages.SNAPSHOT_VERSION_ERROR + f"{version}")
+
+        root = self._collection_dir(self._model_id(), col)
+        if not os.path.isdir(root):
+            return None
+
+        if version is not None:
+            path = os.path.join(root, version)
+            return path if os.path.isfile(os.path.join(path, "manifest.json")) else None
+
+        versions = sorted(
+            v for v in os.listdir(root)
+            if VERSION_PATTERN.match(v) and os.path.isfile(os.path.join(root, v, "manifest.json"))
+        )
+        return os.path.join(root, versions[-1]) if versions else None
+
+    def prune_snapshots(self, col: str, keep: int):
+        """현재 임베딩 모델 기준으로 컬렉션의 최근 스냅샷 keep개만 남기고 삭제합니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+            keep (int): 남겨 둘 최근 스냅샷 수.
+
+        Returns:
+            int: 삭제한 스냅샷 수.
+        """
+        root = self._collection_dir(self._model_id(), col)
+        if not os.path.isdir(root):
+            return 0
+
+        versions = sorted(v for v in os.listdir(root) if VERSION_PATTERN.match(v))
+        pruned = versions[:-keep] if keep > 0 else []
+        for version in pruned:
+            shutil.rmtree(os.path.join(root, version), ignore_errors=True)
+
+        if pruned:
+            logger.info(ServerMessages.SNAPSHOT_PRUNE.format(collection=col, count=len(pruned)))
+        return len(pruned)
+
+    def _resize_array(self, path: str, array, count: int, shape: tuple):
+        """memory-map 배열 파일을 새 크기로 다시 만들고 앞의 count건을 복사합니다.
+
+        Args:
+            path (str): .npy 파일 경로.
+            array (np.memmap): 기존 배열.
+            count (int): 복사할 건수.
+            shape (tuple): 새 배열 크기.
+
+        Returns:
+            np.memmap: 새 크기의 배열.
+        """
+        resized = np.lib.format.open_memmap(path + ".resize", mode="w+", dtype=array.dtype, shape=shape)
+        resized[:count] = array[:count]
+        resized.flush()
+        del array
+        os.replace(path + ".resize", path)
+        return resized
+
+    def export_snapshot(self, collection_names: str):
+        """Milvus 컬렉션의 id, 텍스트, 임베딩 벡터를 스냅샷으로 내보냅니다.
+
+        Args:
+            collection_names (str): 내보낼 컬렉션 이름.
+
+        Returns:
+            dict: 성공 여부, 스냅샷 버전 및 건수.
+        """
+        col = collection_names
+        logger.info(ServerMessages.SNAPSHOT_EXPORT_START.format(collection=col))
+        tmp_path = None
+
+        try:
+            model = self._model_id()
+            collection = Collection(col)
+            collection.flush()
+
+            # num_entities는 삭제된 엔티티를 포함하므로 실제 건수로 배열 크기를 정함
+            capacity = collection.query(expr="", output_fields=["count(*)"])[0]["count(*)"]
+            dim = next(f.params["dim"] for f in collection.schema.fields if f.name == "embedding")
+
+            version = datetime.now().strftime("%Y%m%d%H%M%S")
+            path = os.path.join(self._collection_dir(model, col), version)
+            tmp_path = path + ".tmp"
+            os.makedirs(tmp_path, exist_ok=True)
+
+            ids_path = os.path.join(tmp_path, "ids.npy")
+            embeddings_path = os.path.join(tmp_path, "embeddings.npy")
+            ids = np.lib.format.open_memmap(ids_path, mode="w+", dtype=np.int64, shape=(capacity,))
+            embeddings = np.lib.format.open_memmap(embeddings_path, mode="w+", dtype=np.float32, shape=(capacity, dim))
+            texts = []
+
+            count = 0
+            iterator = collection.query_iterator(
+                batch_size=self.snapshot_config.batch_size,
+                output_fields=["id", "text", "embedding"]
+            )
+            while True:
+                rows = iterator.next()
+                if not rows:
+                    iterator.close()
+                    break
+                end = count + len(rows)
+                # 내보내는 도중 등록된 데이터로 건수가 늘어나면 배열을 키움
+                if end > capacity:
+                    capacity = max(end, capacity * 2)
+                    ids = self._resize_array(ids_path, ids, count, (capacity,))
+                    embeddings = self._resize_array(embeddings_path, embeddings, count, (capacity, dim))
+                ids[count:end] = [row["id"] for row in rows]
+                embeddings[count:end] = [row["embedding"] for row in rows]
+                texts.extend(row["text"] for row in rows)
+                count = end
+
+            if count != capacity:
+                ids = self._resize_array(ids_path, ids, count, (count,))
+                embeddings = self._resize_array(embeddings_path, embeddings, count, (count, dim))
+            ids.flush()
+            embeddings.flush()
+            del ids, embeddings
+
+            with open(os.path.join(tmp_path, "texts.json"), "w", encoding="utf-8") as f:
+                json.dump(texts, f, ensure_ascii=False)
+
+            manifest = {
+                "collection": col,
+                "model": model,
+                "version": version,
+                "count": count,
+                "dim": dim,
+                "created_at": datetime.now().isoformat()
+            }
+            with open(os.path.join(tmp_path, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+            os.rename(tmp_path, path)
+
+            logger.info(ServerMessages.SNAPSHOT_EXPORT_COMPLETE.format(path=path))
+            return {"status": "success", "version": version, "count": count}
+
+        except Exception as e:
+            logger.error(ServerMessages.SNAPSHOT_EXPORT_ERROR + f"{e}")
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            return {"status": "error", "detail": str(e)}
+
+    def load_snapshot(self, path: str):
+        """스냅샷 디렉토리를 memory-map 배열로 불러옵니다.
+
+        Args:
+            path (str): 스냅샷 디렉토리 경로.
+
+        Returns:
+            tuple: (manifest dict, ids np.memmap, embeddings np.memmap)
+        """
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        count = manifest["count"]
+        ids = np.load(os.path.join(path, "ids.npy"), mmap_mode="r")[:count]
+        embeddings = np.load(os.path.join(path, "embeddings.npy"), mmap_mode="r")[:count]
+        return manifest, ids, embeddings
+
+    def _validate_snapshot(self, col: str, manifest: dict, ids, embeddings, texts: list):
+        """복원 전에 스냅샷이 현재 컬렉션 스키마 및 자기 자신과 일치하는지 검증합니다.
+
+        Args:
+            col (str): 복원할 컬렉션 이름.
+            manifest (dict): 스냅샷 메타 정보.
+            ids (np.memmap): id 배열.
+            embeddings (np.memmap): 임베딩 행렬.
+            texts (list): 임베딩 원문 텍스트 목록.
+
+        Raises:
+            ValueError: 검증에 실패한 경우.
+        """
+        count = manifest["count"]
+        checks = [
+            (col in self.config.data.collection, f"collection={col}"),
+            (manifest["collection"] == col, f"manifest collection={manifest['collection']}"),
+            (manifest["dim"] == self.config.milvus.dim, f"dim={manifest['dim']} (expected {self.config.milvus.dim})"),
+            (len(ids) == count, f"ids={len(ids)} (expected {count})"),
+            (embeddings.shape == (count, manifest["dim"]), f"embeddings={embeddings.shape}"),
+            (len(texts) == count, f"texts={len(texts)} (expected {count})"),
+        ]
+        errors = [message for ok, message in checks if not ok]
+        if errors:
+            raise ValueError(ServerMessages.SNAPSHOT_INVALID + ", ".join(errors))
+
+    def restore_snapshot(self, collection_names: str, version: str = None):
+        """스냅샷을 새 Milvus 컬렉션에 재임베딩 없이 일괄 적재합니다.
+
+        스냅샷을 먼저 검증한 뒤 임시 컬렉션에 적재하고, 적재가 끝나면 기존 컬렉션과 교체합니다.
+        검증이나 적재에 실패하면 기존 컬렉션은 그대로 유지되며, 교체 중 이름 변경에 실패하면
+        복원된 데이터가 담긴 임시 컬렉션을 남겨 두고 그 이름을 오류로 반환합니다.
+
+        Args:
+            collection_names (str): 복원할 컬렉션 이름.
+            version (str, optional): 복원할 스냅샷 버전. None이면 가장 최근 버전.
+
+        Returns:
+            dict: 성공 여부, 복원한 스냅샷 버전 및 건수.
+        """
+        col = collection_names
+        tmp_col = None
+
+        try:
+            path = self.get_latest_snapshot(col, version)
+            if path is None:
+                raise FileNotFoundError(ServerMessages.SNAPSHOT_NOT_FOUND + f"{col}")
+            logger.info(ServerMessages.SNAPSHOT_RESTORE_START.format(path=path))
+
+            manifest, ids, embeddings = self.load_snapshot(path)
+            with open(os.path.join(path, "texts.json"), encoding="utf-8") as f:
+                texts = json.load(f)
+            self._validate_snapshot(col, manifest, ids, embeddings, texts)
+
+            tmp_col = f"{col}_restore_{manifest['version']}"
+            if utility.has_collection(tmp_col):
+                utility.drop_collection(tmp_col)
+            collection = self.initialize_db.create_milvus_collection(tmp_col)
+
+            for start in trange(0, manifest["count"], self.snapshot_config.batch_size):
+                end = start + self.snapshot_config.batch_size
+                collection.insert([ids[start:end].tolist(), texts[start:end], embeddings[start:end].tolist()])
+            collection.flush()
+
+            if collection.num_entities != manifest["count"]:
+                raise ValueError(
+                    ServerMessages.SNAPSHOT_INVALID + f"loaded={collection.num_entities} (expected {manifest['count']})"
+                )
+
+            # 적재가 끝난 뒤에만 기존 컬렉션을 교체하며, 기존 컬렉션 삭제 이후에는
+            # 임시 컬렉션이 유일한 복사본이므로 이름 변경에 실패해도 정리하지 않음
+            loaded_col, tmp_col = tmp_col, None
+            if utility.has_collection(col):
+                utility.drop_collection(col)
+            try:
+                utility.rename_collection(loaded_col, col)
+            except Exception as e:
+                raise RuntimeError(ServerMessages.SNAPSHOT_RENAME_ERROR.format(collection=loaded_col) + f"{e}") from e
+
+            logger.info(ServerMessages.SNAPSHOT_RESTORE_COMPLETE.format(collection=col))
+            return {"status": "success", "version": manifest["version"], "count": manifest["count"]}
+
+        except Exception as e:
+            logger.error(ServerMessages.SNAPSHOT_RESTORE_ERROR + f"{e}")
+            return {"status": "error", "detail": str(e)}
+
+        finally:
+            # 실패 시 임시 컬렉션만 정리하고 기존 컬렉션은 유지
+            if tmp_col is not None:
+                try:
+                    if utility.has_collection(tmp_col):
+                        utility.drop_collection(tmp_col)
+                except Exception as e:
+                    logger.error(ServerMessages.SNAPSHOT_RESTORE_ERROR + f"{e}")
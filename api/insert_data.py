@@ -1,12 +1,17 @@
+import os
 import json
+import time
+import requests
 import pandas as pd
 import logging
+from datetime import datetime
 from snowflake import SnowflakeGenerator
 from pymilvus import Collection
+from sqlalchemy import text
 from fastapi import UploadFile
 from tqdm import trange
 from core.messages import ServerMessages
-from services.text_embedding import TextEmbeddings
+from services.text_embedding import TextEmbeddings, EmbeddingCountError
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -18,30 +23,38 @@ class InsertData:
         text_embedding (TextEmbeddings): 텍스트 임베딩 처리 클래스.
         gen (SnowflakeGenerator): 고유 ID 생성을 위한 Snowflake ID 생성기.
         initialize_db (InitializeDB): DB 초기화 및 연결 클래스.
+        local_index (LocalVectorIndex | None): 데이터 변경 시 무효화할 로컬 벡터 검색 객체.
         config (AppConfig): 전체 애플리케이션 설정 객체.
         mariadb_config (MariaDBConfig): MariaDB 설정 객체.
         milvus_config (MilvusConfig): Milvus 설정 객체.
         embedding_config (EmbeddingConfig): 임베딩 서버 설정 객체.
+        ingest_config (IngestConfig): 임베딩 재시도 및 실패 데이터 기록 설정 객체.
         data_config (DataConfig): 데이터 컬럼 및 컬렉션 설정 객체.
     """
 
-    def __init__(self, config, initialize_db):
+    def __init__(self, config, initialize_db, local_index=None):
         """RegistData 클래스 초기화
 
         Args:
             config (AppConfig): 앱 설정 객체.
             initialize_db (InitializeDB): DB 연결 및 초기화 객체.
+            local_index (LocalVectorIndex, optional): 로컬 벡터 검색 객체.
         """
         self.text_embedding = TextEmbeddings()
         self.gen = SnowflakeGenerator(42)
 
         self.initialize_db = initialize_db
+        self.local_index = local_index
         self.config = config
         self.mariadb_config = config.mariadb
         self.milvus_config = config.milvus
         self.embedding_config = config.embedding
+        self.ingest_config = config.ingest
         self.data_config = config.data
 
+        self.column_map = {list(d.keys())[0]: d[list(d.keys())[0]] for d in self.data_config.column}
+        self.file_name_column = self.column_map["FileName"]
+
     def _convert_data(self, data):
         """업로드된 JSON 데이터를 Pandas DataFrame으로 변환합니다.
 
@@ -52,13 +65,12 @@ class InsertData:
             pd.DataFrame: 변환된 DataFrame 객체.
         """
         try:
-            column_map = {list(d.keys())[0]: d[list(d.keys())[0]] for d in self.data_config.column}
             df = pd.DataFrame([
                 {"FileName": k, **v["CategoricalValues"], "DetailedSummary": v["DetailedSummary"]}
                 for k, v in data.items()
             ])
             df['id'] = [next(self.gen) for _ in range(len(df))]
-            df.rename(columns=column_map, inplace=True)
+            df.rename(columns=self.column_map, inplace=True)
 
             columns_to_convert = [col for col in df.columns if col != 'id']
             for col in columns_to_convert:
@@ -69,6 +81,130 @@ class InsertData:
         except Exception as e:
             logger.error(ServerMessages.JSON_CONVERT_ERROR + f"{e}")
 
+    def _invalidate_local_index(self):
+        """Milvus 데이터가 바뀌므로 로컬 인덱스를 빠른 경로에서 제외합니다."""
+        if self.local_index is not None:
+            for col in self.data_config.collection:
+                self.local_index.invalidate(col)
+
+    def _is_transient(self, error: Exception):
+        """임베딩 서버의 일시적 오류인지 확인합니다.
+
+        Args:
+            error (Exception): 임베딩 요청 중 발생한 예외.
+
+        Returns:
+            bool: 연결 오류, 타임아웃, 408/429/5xx 응답이면 True.
+        """
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        response = getattr(error, "response", None)
+        return response is not None and (response.status_code in (408, 429) or response.status_code >= 500)
+
+    def _is_record_error(self, error: Exception):
+        """배치 안의 특정 레코드 때문에 발생한 오류인지 확인합니다.
+
+        Args:
+            error (Exception): 임베딩 요청 중 발생한 예외.
+
+        Returns:
+            bool: 400/413/422 응답이거나 결과 수 불일치이면 True.
+        """
+        if isinstance(error, EmbeddingCountError):
+            return True
+        response = getattr(error, "response", None)
+        return response is not None and response.status_code in (400, 413, 422)
+
+    def _embed_with_retry(self, texts: list):
+        """임베딩 요청을 재시도하고, 레코드 단위 오류이면 배치를 반으로 나누어 다시 요청합니다.
+
+        연결 오류, 타임아웃, 408/429/5xx 응답은 일시적 오류로 보고 지수 백오프로 재시도하며,
+        재시도 횟수를 넘기면 예외를 다시 발생시켜 등록 작업 전체를 중단합니다.
+        400/413/422 응답과 결과 수 불일치는 레코드 단위 오류로 보고 재시도 없이 배치를 분할하며,
+        한 건까지 나누어도 실패하면 해당 텍스트만 실패로 처리합니다.
+        인증 오류, 잘못된 URL, 응답 형식 변경 등 그 외 오류는 바로 다시 발생시켜 등록 작업을 중단합니다.
+
+        Args:
+            texts (list): 임베딩할 텍스트 리스트.
+
+        Returns:
+            tuple(list, list): 텍스트별 임베딩 벡터(실패 시 None)와 실패 사유(성공 시 None).
+
+        Raises:
+            Exception: 일시적 오류가 재시도 횟수를 넘겨 계속되거나 레코드 단위가 아닌 오류가 발생한 경우.
+        """
+        error = None
+        for attempt in range(self.ingest_config.max_retries + 1):
+            try:
+                return self.text_embedding.request_embeddings(texts), [None] * len(texts)
+            except Exception as e:
+                error = e
+                if self._is_record_error(e):
+                    break
+                if not self._is_transient(e):
+                    logger.error(ServerMessages.EMBEDDING_ERROR + f"{e}")
+                    raise
+                if attempt == self.ingest_config.max_retries:
+                    logger.error(ServerMessages.EMBEDDING_UNAVAILABLE + f"{e}")
+                    raise
+                logger.warning(ServerMessages.EMBEDDING_RETRY.format(
+                    attempt=attempt + 1, max_retries=self.ingest_config.max_retries, count=len(texts)
+                ) + f"{e}")
+                time.sleep(self.ingest_config.retry_backoff * (2 ** attempt))
+
+        if len(texts) == 1:
+            return [None], [f"{type(error).__name__}: {error}"]
+
+        logger.warning(ServerMessages.EMBEDDING_BISECT.format(count=len(texts)))
+        mid = len(texts) // 2
+        left_vectors, left_errors = self._embed_with_retry(texts[:mid])
+        right_vectors, right_errors = self._embed_with_retry(texts[mid:])
+        return left_vectors + right_vectors, left_errors + right_errors
+
+    def _embed_batch(self, batch: pd.DataFrame, col: str, dead_letters: list):
+        """배치의 컬렉션 컬럼을 임베딩하고, 실패한 레코드는 dead_letters에 추가합니다.
+
+        Args:
+            batch (pd.DataFrame): 임베딩할 레코드 배치.
+            col (str): 임베딩할 컬럼(컬렉션) 이름.
+            dead_letters (list): 실패 레코드를 누적할 리스트.
+
+        Returns:
+            list: 레코드별 임베딩 벡터. 실패한 레코드는 None.
+        """
+        texts = batch[col].astype(str).tolist()
+        vectors, errors = self._embed_with_retry(texts)
+
+        for id_val, file_name, text_val, error in zip(
+            batch['id'], batch[self.file_name_column], texts, errors
+        ):
+            if error is not None:
+                dead_letters.append({
+                    "id": int(id_val),
+                    "file_name": file_name,
+                    "collection": col,
+                    "text_length": len(text_val),
+                    "reason": error,
+                    "created_at": datetime.now().isoformat()
+                })
+        return vectors
+
+    def _write_dead_letters(self, dead_letters: list):
+        """임베딩에 실패한 레코드를 dead letter JSONL 파일에 추가 기록합니다.
+
+        Args:
+            dead_letters (list): 실패 레코드 리스트.
+        """
+        if not dead_letters:
+            return
+
+        path = self.ingest_config.dead_letter_path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for record in dead_letters:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        logger.warning(ServerMessages.DATA_DEAD_LETTER.format(count=len(dead_letters), path=path))
+
     def data_insert(self, file: UploadFile):
         """JSONL 파일을 MariaDB와 Milvus에 삽입합니다.
 
@@ -88,33 +224,245 @@ class InsertData:
         logger.info(ServerMessages.DATA_INSERT_START)
         logger.info(ServerMessages.DATA_INSERT_INFO.format(len=len(df), batch=self.embedding_config.batch_size))
 
+        dead_letters = []
+        self._invalidate_local_index()
         try:
             with self.initialize_db.engine.begin() as conn:
                 for start in trange(0, len(df), self.embedding_config.batch_size):
                     end = start + self.embedding_config.batch_size
                     batch = df.iloc[start:end]
+
+                    # 임베딩에 실패한 레코드는 제외하고 나머지만 등록
+                    vectors = {col: self._embed_batch(batch, col, dead_letters) for col in self.data_config.collection}
+                    keep = [all(vectors[col][i] is not None for col in vectors) for i in range(len(batch))]
+                    batch = batch[keep]
+                    if batch.empty:
+                        continue
+
                     batch.to_sql(name=self.mariadb_config.table, con=conn, if_exists='append', index=False)
 
                     for col in self.data_config.collection:
-                        embedding_result = self.text_embedding.get_embeddings(batch[col].tolist())
+                        embedding_result = [vector for vector, k in zip(vectors[col], keep) if k]
 
                         collection = Collection(col)
                         collection.insert([batch['id'].tolist(), batch[col].tolist(), embedding_result])
                         collection.flush()
 
                 logger.info(ServerMessages.DATA_INSERT_COMPLETE)
-                return {"status": "success"}
+                return {
+                    "status": "success",
+                    "inserted": len(df) - len({d["id"] for d in dead_letters}),
+                    "dead_lettered": len({d["id"] for d in dead_letters})
+                }
 
         except Exception as e:
             logger.error(ServerMessages.DATA_INSERT_ERROR + f"{e}")
             return {"status": "error", "detail": str(e)}
 
+        finally:
+            self._write_dead_letters(dead_letters)
+
+    def _select_by_file_name(self, conn, file_names: list):
+        """file_name 목록에 해당하는 MariaDB 레코드를 조회합니다.
+
+        기존 data_insert로 같은 file_name이 여러 번 등록되었을 수 있으므로 file_name별 레코드 목록을 반환합니다.
+
+        Args:
+            conn (Connection): SQLAlchemy 연결 객체.
+            file_names (list): 조회할 file_name 목록.
+
+        Returns:
+            dict: file_name을 키로 하고 id 오름차순 레코드 리스트를 값으로 하는 딕셔너리.
+        """
+        rows = {}
+        for start in range(0, len(file_names), self.embedding_config.batch_size):
+            chunk = file_names[start:start + self.embedding_config.batch_size]
+            placeholders = ", ".join([":fn{}".format(i) for i in range(len(chunk))])
+            sql = text(
+                f"SELECT * FROM {self.mariadb_config.table} "
+                f"WHERE {self.file_name_column} IN ({placeholders}) ORDER BY id"
+            )
+            params = {f"fn{i}": fn for i, fn in enumerate(chunk)}
+
+            for row in conn.execute(sql, params).fetchall():
+                record = dict(row._mapping)
+                rows.setdefault(record[self.file_name_column], []).append(record)
+        return rows
+
+    def _delete_ids(self, conn, id_list: list):
+        """id 목록에 해당하는 레코드를 MariaDB와 모든 Milvus 컬렉션에서 삭제합니다.
+
+        Args:
+            conn (Connection): SQLAlchemy 연결 객체.
+            id_list (list): 삭제할 id 목록.
+        """
+        if not id_list:
+            return
+
+        collections = [Collection(col) for col in self.data_config.collection]
+        for start in range(0, len(id_list), self.embedding_config.batch_size):
+            chunk = id_list[start:start + self.embedding_config.batch_size]
+            placeholders = ", ".join([":id{}".format(i) for i in range(len(chunk))])
+            sql = text(f"DELETE FROM {self.mariadb_config.table} WHERE id IN ({placeholders})")
+            conn.execute(sql, {f"id{i}": id_val for i, id_val in enumerate(chunk)})
+
+            for collection in collections:
+                collection.delete(expr=f"id in {chunk}")
+
+        for collection in collections:
+            collection.flush()
+
+    def data_upsert(self, file: UploadFile):
+        """JSON 파일을 file_name 기준으로 MariaDB와 Milvus에 갱신 또는 삽입합니다.
+
+        기존 file_name은 가장 최근 id를 유지한 채 MariaDB 레코드를 갱신하고 나머지 중복 레코드는 삭제하며,
+        임베딩 대상 텍스트가 바뀐 레코드만 다시 임베딩하여 Milvus에 upsert 합니다.
+
+        Args:
+            file (UploadFile): FastAPI 업로드 객체.
+
+        Returns:
+            dict: 처리 결과(삽입/갱신/변경 없음/재임베딩/중복 삭제 수)를 담은 딕셔너리.
+        """
+        try:
+            data = json.load(file.file)
+            logger.info(ServerMessages.JSON_LOAD_SUCCESS)
+        except Exception as e:
+            logger.error(ServerMessages.JSON_LOAD_ERROR + f"{e}")
+            return {"status": "error", "detail": str(e)}
+
+        df = self._convert_data(data)
+        if df is None:
+            return {"status": "error", "detail": ServerMessages.JSON_CONVERT_ERROR}
+
+        logger.info(ServerMessages.DATA_UPSERT_START)
+        logger.info(ServerMessages.DATA_INSERT_INFO.format(len=len(df), batch=self.embedding_config.batch_size))
+
+        dead_letters = []
+        self._invalidate_local_index()
+        try:
+            with self.initialize_db.engine.begin() as conn:
+                groups = self._select_by_file_name(conn, df[self.file_name_column].tolist())
+
+                # 기존 레코드는 가장 최근 id를 유지하고, 이전 data_insert로 생긴 중복 레코드는 삭제 대상
+                existing = {fn: records[-1] for fn, records in groups.items()}
+                duplicate_ids = [record['id'] for records in groups.values() for record in records[:-1]]
+
+                is_new = ~df[self.file_name_column].isin(list(existing))
+                df['id'] = [
+                    existing[fn]['id'] if fn in existing else id_val
+                    for fn, id_val in zip(df[self.file_name_column], df['id'])
+                ]
+
+                data_columns = [col for col in df.columns if col != 'id']
+                is_changed = pd.Series(
+                    [
+                        new or any(existing[fn].get(col) != value for col, value in zip(data_columns, values))
+                        for new, fn, values in zip(
+                            is_new, df[self.file_name_column], df[data_columns].itertuples(index=False)
+                        )
+                    ],
+                    index=df.index
+                )
+
+                # 임베딩 대상 텍스트가 바뀐 레코드만 재임베딩
+                targets = {}
+                vectors = {}
+                for col in self.data_config.collection:
+                    targets[col] = df[
+                        is_new | pd.Series(
+                            [existing.get(fn, {}).get(col) != value for fn, value in zip(df[self.file_name_column], df[col])],
+                            index=df.index
+                        )
+                    ]
+                    vectors[col] = []
+                    for start in trange(0, len(targets[col]), self.embedding_config.batch_size):
+                        end = start + self.embedding_config.batch_size
+                        vectors[col].extend(self._embed_batch(targets[col].iloc[start:end], col, dead_letters))
+
+                # 임베딩에 실패한 레코드는 MariaDB와 Milvus 모두 갱신하지 않음
+                failed_ids = {d["id"] for d in dead_letters}
+                is_ok = ~df['id'].isin(failed_ids)
+
+                new_rows = df[is_new & is_ok]
+                updated_rows = df[~is_new & is_changed & is_ok]
+
+                if len(new_rows):
+                    new_rows.to_sql(name=self.mariadb_config.table, con=conn, if_exists='append', index=False)
+
+                if len(updated_rows):
+                    assignments = ", ".join([f"{col} = :{col}" for col in data_columns])
+                    sql = text(f"UPDATE {self.mariadb_config.table} SET {assignments} WHERE id = :id")
+                    conn.execute(sql, updated_rows.to_dict(orient="records"))
+
+                self._delete_ids(conn, duplicate_ids)
+
+                reembedded = {}
+                for col, target in targets.items():
+                    keep = [id_val not in failed_ids for id_val in target['id']]
+                    target = target[keep]
+                    embedding_result = [vector for vector, k in zip(vectors[col], keep) if k]
+
+                    collection = Collection(col)
+                    for start in range(0, len(target), self.embedding_config.batch_size):
+                        end = start + self.embedding_config.batch_size
+                        batch = target.iloc[start:end]
+                        collection.upsert([batch['id'].tolist(), batch[col].tolist(), embedding_result[start:end]])
+                    collection.flush()
+                    reembedded[col] = len(target)
+
+                logger.info(ServerMessages.DATA_UPSERT_COMPLETE)
+                return {
+                    "status": "success",
+                    "inserted": len(new_rows),
+                    "updated": len(updated_rows),
+                    "unchanged": len(df[~is_new & ~is_changed]),
+                    "reembedded": reembedded,
+                    "duplicates_removed": len(duplicate_ids),
+                    "dead_lettered": len(failed_ids)
+                }
+
+        except Exception as e:
+            logger.error(ServerMessages.DATA_UPSERT_ERROR + f"{e}")
+            return {"status": "error", "detail": str(e)}
+
+        finally:
+            self._write_dead_letters(dead_letters)
+
+    def data_delete(self, file_names: list):
+        """file_name 목록에 해당하는 데이터를 MariaDB와 Milvus에서 삭제합니다.
+
+        Args:
+            file_names (list): 삭제할 file_name 목록.
+
+        Returns:
+            dict: 삭제 성공 여부와 삭제된 레코드 수.
+        """
+        logger.info(ServerMessages.DATA_DELETE_START)
+        self._invalidate_local_index()
+
+        try:
+            with self.initialize_db.engine.begin() as conn:
+                existing = self._select_by_file_name(conn, list(file_names))
+                id_list = [record['id'] for records in existing.values() for record in records]
+
+                self._delete_ids(conn, id_list)
+
+                logger.info(ServerMessages.DATA_DELETE_COMPLETE)
+                return {"status": "success", "deleted": len(id_list)}
+
+        except Exception as e:
+            logger.error(ServerMessages.DATA_DELETE_ERROR + f"{e}")
+            return {"status": "error", "detail": str(e)}
+
     def dev_embedding_insert_only(self):
         """MariaDB 데이터를 Milvus에 임베딩하여 삽입하는 개발용 메서드입니다.
 
         Returns:
             dict: 삽입 성공 여부 결과.
         """
+        dead_letters = []
+        self._invalidate_local_index()
         try:
             with self.initialize_db.engine.begin() as conn:
                 df = pd.read_sql_table(self.mariadb_config.table, con=conn)
@@ -127,16 +475,24 @@ class InsertData:
                 batch = df.iloc[start:end]
 
                 for col in self.data_config.collection:
-                    texts = batch[col].astype(str).tolist()
-                    embedding_result = self.text_embedding.get_embeddings(texts)
+                    vectors = self._embed_batch(batch, col, dead_letters)
+                    keep = [vector is not None for vector in vectors]
+                    if not any(keep):
+                        continue
+
+                    texts = batch[col].astype(str)[keep].tolist()
+                    embedding_result = [vector for vector in vectors if vector is not None]
 
                     collection = Collection(col)
-                    collection.insert([batch['id'].tolist(), texts, embedding_result])
+                    collection.insert([batch['id'][keep].tolist(), texts, embedding_result])
                     collection.flush()
 
             logger.info(ServerMessages.DATA_INSERT_COMPLETE)
-            return {"status": "success"}
+            return {"status": "success", "dead_lettered": len({d["id"] for d in dead_letters})}
 
         except Exception as e:
             logger.error(ServerMessages.DATA_INSERT_ERROR + f"{e}")
-            return {"status": "error", "detail": str(e)}
\ No newline at end of file
+            return {"status": "error", "detail": str(e)}
+
+        finally:
+            self._write_dead_letters(dead_letters)
\ No newline at end of file
@@ -1,8 +1,6 @@
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from pymilvus import connections, Collection
-from typing import Any
+from sqlalchemy import text
+from fastapi.concurrency import run_in_threadpool
 from services.text_embedding import TextEmbeddings
 from core.messages import ServerMessages
 
@@ -15,6 +13,7 @@ class VectorSearch:
     Attributes:
         text_embedding (TextEmbeddings): 텍스트 임베딩 생성기.
         initialize_db (InitializeDB): DB 엔진 접근을 위한 초기화 객체.
+        local_index (LocalVectorIndex | None): 프로세스 내 로컬 벡터 검색 객체.
         config (AppConfig): 앱 전역 설정 객체.
         mariadb_config (MariaDBConfig): MariaDB 설정 객체.
         milvus_config (MilvusConfig): Milvus 설정 객체.
@@ -22,16 +21,18 @@ class VectorSearch:
         data_config (DataConfig): 데이터 스키마 및 컬렉션 설정 객체.
     """
 
-    def __init__(self, config, initialize_db):
+    def __init__(self, config, initialize_db, local_index=None):
         """VectorSearch 클래스 초기화 메서드.
 
         Args:
             config (AppConfig): 설정 객체.
             initialize_db (InitializeDB): DB 연결 및 엔진 접근용 객체.
+            local_index (LocalVectorIndex, optional): 로컬 벡터 검색 객체.
         """
         self.text_embedding = TextEmbeddings()
 
         self.initialize_db = initialize_db
+        self.local_index = local_index
 
         self.config = config
         self.mariadb_config = config.mariadb
@@ -39,7 +40,20 @@ class VectorSearch:
         self.embedding_config = config.embedding
         self.data_config = config.data
 
-    def _milvus_search(self, col: str, metric_type: str, nprobe: int, embedded_data: list, top_k: int, output_fields: list):
+        self.columns = ["id"] + [list(col.values())[0] for col in self.data_config.column]
+
+    def invalid_fields(self, fields: list):
+        """테이블에 존재하지 않는 필드 이름을 반환합니다.
+
+        Args:
+            fields (list): 요청된 필드 목록.
+
+        Returns:
+            list: 존재하지 않는 필드 목록.
+        """
+        return [field for field in fields or [] if field not in self.columns]
+
+    async def _milvus_search(self, col: str, metric_type: str, nprobe: int, embedded_data: list, top_k: int, output_fields: list):
         """Milvus에서 벡터 유사도 검색을 수행합니다.
 
         Args:
@@ -59,11 +73,11 @@ class VectorSearch:
                 "params": {"nprobe": nprobe}
             }
 
-            collection = Collection(col)
-            results = collection.search(
+            results = await self.initialize_db.async_milvus_client.search(
+                collection_name=col,
                 data=embedded_data,
                 anns_field="embedding",
-                param=search_params,
+                search_params=search_params,
                 limit=top_k,
                 output_fields=output_fields
             )
@@ -73,46 +87,91 @@ class VectorSearch:
         except Exception as e:
             logger.error(ServerMessages.MILVUS_SEARCH_ERROR + f"{e}")
 
-    def _mariadb_search(self, id_list: list):
+    async def _mariadb_search(self, id_list: list, fields: list = None):
         """Milvus 검색 결과로 얻은 ID를 통해 MariaDB에서 상세 데이터를 조회합니다.
 
         Args:
             id_list (list): Milvus 검색 결과에서 추출한 ID 리스트.
+            fields (list, optional): 조회할 컬럼 목록. None이면 전체 컬럼.
 
         Returns:
-            list[dict]: 조회된 MariaDB 레코드 목록.
+            list[dict]: id_list 순서로 정렬된 MariaDB 레코드 목록.
         """
+        if not id_list:
+            return []
+
         try:
-            with self.initialize_db.engine.connect() as conn:
+            async with self.initialize_db.async_engine.connect() as conn:
                 placeholders = ", ".join([":id{}".format(i) for i in range(len(id_list))])
-                sql = text(f"SELECT * FROM {self.mariadb_config.table} WHERE id IN ({placeholders})")
+                select_columns = "*" if fields is None else ", ".join(["id"] + [f for f in fields if f != "id"])
+                sql = text(f"SELECT {select_columns} FROM {self.mariadb_config.table} WHERE id IN ({placeholders})")
                 params = {f"id{i}": id_val for i, id_val in enumerate(id_list)}
 
-                result = conn.execute(sql, params)
-                rows = result.fetchall()
-                return [dict(row._mapping) for row in rows]
+                result = await conn.execute(sql, params)
+                rows = {row.id: dict(row._mapping) for row in result.fetchall()}
+                return [rows[id_val] for id_val in id_list if id_val in rows]
         except Exception as e:
             logger.error(ServerMessages.MARIA_SEARCH_ERROR + f"{e}")
 
-    def only_vector(self, collection_names: str, query_text: str, top_k: int):
+    async def _vector_search(self, col: str, embedded_data: list, top_k: int):
+        """작은 컬렉션은 로컬 인덱스로, 그 외에는 Milvus로 검색하고 Milvus 실패 시 로컬 인덱스로 대체합니다.
+
+        Args:
+            col (str): 검색할 컬렉션 이름.
+            embedded_data (list): 쿼리 임베딩 벡터 리스트.
+            top_k (int): 반환할 유사 결과 수.
+
+        Returns:
+            list[tuple]: 첫 번째 쿼리의 (id, score) 목록.
+        """
+        local_index = self.local_index
+        if local_index is not None and local_index.is_fast_path(col):
+            return (await run_in_threadpool(local_index.search, col, embedded_data, top_k))[0]
+
+        metric_type = "COSINE"
+        nprobe = 10
+        output_fields = ["id"]
+
+        milvus_result = await self._milvus_search(col, metric_type, nprobe, embedded_data, top_k, output_fields)
+        if milvus_result is None and local_index is not None and local_index.can_fallback(col):
+            logger.warning(ServerMessages.LOCAL_SEARCH_FALLBACK + f"{col}")
+            return (await run_in_threadpool(local_index.search, col, embedded_data, top_k))[0]
+
+        return [(hit["id"], hit["distance"]) for hit in milvus_result[0]]
+
+    async def only_vector(self, collection_names: str, query_text: str, top_k: int, fields: list = None, compact: bool = False):
         """텍스트 쿼리를 임베딩하여 Milvus에서 유사 문서 검색 후 MariaDB에서 상세 정보 반환.
 
         Args:
             collection_names (str): 검색 대상 컬렉션 이름.
             query_text (str): 사용자가 입력한 검색 쿼리.
             top_k (int): 검색 결과 개수.
+            fields (list, optional): 반환할 컬럼 목록. None이면 전체 컬럼.
+            compact (bool): True이면 id와 score를 문자열로 변환하고 score를 포함하여 반환.
 
         Returns:
-            list[dict]: 유사도 기반 검색 결과 상세 정보 리스트.
+            list[dict]: 유사도 순으로 정렬된 검색 결과 상세 정보 리스트.
         """
         col = collection_names
-        metric_type = "COSINE"
-        nprobe = 10
-        embedded_data = self.text_embedding.get_embeddings([query_text])
-        output_fields = ["id"]
+        embedded_data = await self.text_embedding.aget_embeddings([query_text])
+
+        hits = await self._vector_search(col, embedded_data, top_k)
+        id_list = [hit_id for hit_id, _ in hits]
+        mariadb_result = await self._mariadb_search(id_list, fields)
+        if not mariadb_result:
+            return mariadb_result
+
+        if compact:
+            # JS 클라이언트의 bigint 정밀도 손실을 막기 위해 id와 score를 문자열로 반환
+            scores = dict(hits)
+            return [{**row, "id": str(row["id"]), "score": f"{scores[row['id']]:.6f}"} for row in mariadb_result]
+
+        if fields is not None and "id" not in fields:
+            for row in mariadb_result:
+                del row["id"]
 
-        milvus_result = self._milvus_search(col, metric_type, nprobe, embedded_data, top_k, output_fields)
-        id_list = [hit.id for hit in milvus_result[0]]
-        mariadb_result = self._mariadb_search(id_list)
+        return mariadb_result
 
-        return mariadb_result
\ No newline at end of file
+    async def aclose(self):
+        """검색 경로에서 사용하는 비동기 HTTP 클라이언트를 종료합니다."""
+        await self.text_embedding.aclose()
\ No newline at end of file
@@ -1,5 +1,16 @@
 # core/config.py
 
+class ServerConfig:
+    """API 서버 실행 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        thread_pool_size (int): 블로킹 작업을 실행할 스레드 풀 크기.
+    """
+
+    def __init__(self):
+        self.thread_pool_size = 64
+
+
 class MariaDBConfig:
     """MariaDB 관련 설정을 구성하는 클래스입니다.
 
@@ -14,6 +25,8 @@ class MariaDBConfig:
         max_overflow (int): 커넥션 풀 초과 허용 수.
         pool_timeout (int): 커넥션 풀에서 커넥션 요청 대기 시간(초).
         pool_recycle (int): 커넥션 재활용 시간(초).
+        async_pool_size (int): 비동기 커넥션 풀의 초기 사이즈.
+        async_max_overflow (int): 비동기 커넥션 풀 초과 허용 수.
     """
 
     def __init__(self):
@@ -29,6 +42,9 @@ class MariaDBConfig:
         self.pool_timeout = 30
         self.pool_recycle = 1800
 
+        self.async_pool_size = 20
+        self.async_max_overflow = 20
+
 
 class MilvusConfig:
     """Milvus 관련 설정을 구성하는 클래스입니다.
@@ -38,6 +54,7 @@ class MilvusConfig:
         port (int): Milvus gRPC 포트 번호.
         api_port (int): Milvus HTTP API 포트 번호.
         database (str): 사용할 Milvus 데이터베이스 이름.
+        dim (int): 컬렉션 embedding 필드의 벡터 차원.
     """
 
     def __init__(self):
@@ -45,6 +62,7 @@ class MilvusConfig:
         self.port = 19530
         self.api_port = 9091
         self.database = "base_model"
+        self.dim = 1024
 
 
 class EmbeddingConfig:
@@ -54,12 +72,33 @@ class EmbeddingConfig:
         host (str): 임베딩 서버 호스트 주소.
         port (int): 임베딩 서버 포트 번호.
         batch_size (int): 임베딩 요청 시 배치 크기.
+        model (str | None): 임베딩 모델 이름. None이면 임베딩 서버의 `/info`에서 조회.
+        max_connections (int): 비동기 HTTP 클라이언트의 최대 동시 연결 수.
+        timeout (int): 임베딩 요청 타임아웃(초).
     """
 
     def __init__(self):
         self.host = "host.docker.internal"
         self.port = 3201
         self.batch_size = 32
+        self.model = None
+        self.max_connections = 100
+        self.timeout = 30
+
+
+class IngestConfig:
+    """데이터 등록 시 임베딩 재시도 및 실패 데이터 기록 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        max_retries (int): 연결 오류, 타임아웃, 408/429/5xx 응답 시 등록을 중단하기 전까지의 재시도 횟수.
+        retry_backoff (float): 재시도 대기 시간의 기준값(초). 재시도마다 2배씩 증가.
+        dead_letter_path (str): 임베딩에 끝내 실패한 데이터를 기록할 JSONL 파일 경로.
+    """
+
+    def __init__(self):
+        self.max_retries = 3
+        self.retry_backoff = 0.5
+        self.dead_letter_path = "dead_letter/ingest.jsonl"
 
 
 class DataConfig:
@@ -92,20 +131,110 @@ class DataConfig:
         ]
 
 
+class SearchConfig:
+    """검색 응답 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        mcp_header (str): MCP 도구 호출임을 표시하는 요청 헤더 이름.
+        mcp_fields (list): MCP 도구 호출 시 fields를 지정하지 않았을 때 반환할 기본 컬럼 목록.
+    """
+
+    def __init__(self):
+        self.mcp_header = "X-MCP-Client"
+        self.mcp_fields = [
+            "file_name",
+            "name",
+            "age",
+            "education_level",
+            "preferred_position",
+            "experience",
+            "technical_skills",
+        ]
+
+
+class SnapshotConfig:
+    """임베딩 스냅샷 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        path (str): 스냅샷 저장 디렉토리 경로.
+        batch_size (int): Milvus 조회 및 복원 시 배치 크기.
+        keep_versions (int): 로컬 인덱스 동기화 후 모델/컬렉션별로 남겨 둘 최근 스냅샷 수.
+    """
+
+    def __init__(self):
+        self.path = "snapshots"
+        self.batch_size = 1000
+        self.keep_versions = 3
+
+
+class LocalSearchConfig:
+    """프로세스 내 로컬 벡터 검색 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        enabled (bool): 로컬 검색(작은 컬렉션 빠른 경로 및 Milvus 장애 시 대체 경로) 사용 여부.
+        preload (bool): 활성화 시 서버 시작 단계에서 최신 스냅샷을 장애 대체용 로컬 인덱스로 불러올지 여부.
+        fast_path_max_rows (int): 로컬 검색을 우선 사용할 최대 컬렉션 건수.
+        block_size (int): 내적 계산 시 한 번에 처리할 벡터 수.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.preload = True
+        self.fast_path_max_rows = 50000
+        self.block_size = 16384
+
+
+class ProfilingConfig:
+    """요청 프로파일링 설정을 구성하는 클래스입니다.
+
+    Attributes:
+        enabled (bool): 요청 프로파일링 사용 여부. pyinstrument 설치 필요.
+        sample_rate (float): 무작위로 프로파일링할 요청 비율 (0.0 ~ 1.0).
+        interval (float): 샘플링 간격(초).
+        max_profiles (int): 보관할 최근 프로파일 수.
+        admin_token (str | None): 프로파일 조회 및 헤더 기반 프로파일링에 필요한 관리자 토큰.
+        admin_header (str): 관리자 토큰을 전달하는 헤더 이름.
+        profile_header (str): 단건 프로파일링을 요청하는 헤더 이름.
+        exclude_paths (list): 프로파일링하지 않을 경로 접두사 목록 (MCP 스트리밍 연결, 프로파일 조회 등).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 0.0
+        self.interval = 0.001
+        self.max_profiles = 20
+        self.admin_token = None
+        self.admin_header = "X-Admin-Token"
+        self.profile_header = "X-Profile"
+        self.exclude_paths = ["/mcp", "/profiles"]
+
+
 class AppConfig:
     """전체 애플리케이션 설정을 묶는 구성 클래스입니다.
 
-    MariaDB, Milvus, Embedding 서버, 데이터 스키마에 대한 설정 클래스를 포함합니다.
+    API 서버, MariaDB, Milvus, Embedding 서버, 데이터 등록, 데이터 스키마, 검색 응답, 스냅샷, 로컬 검색, 프로파일링에 대한 설정 클래스를 포함합니다.
 
     Attributes:
+        server (ServerConfig): API 서버 실행 설정 인스턴스.
         mariadb (MariaDBConfig): MariaDB 설정 인스턴스.
         milvus (MilvusConfig): Milvus 설정 인스턴스.
         embedding (EmbeddingConfig): 임베딩 서버 설정 인스턴스.
+        ingest (IngestConfig): 데이터 등록 재시도 및 실패 데이터 기록 설정 인스턴스.
         data (DataConfig): 데이터 컬럼 및 컬렉션 설정 인스턴스.
+        search (SearchConfig): 검색 응답 필드 및 MCP 호출 설정 인스턴스.
+        snapshot (SnapshotConfig): 임베딩 스냅샷 설정 인스턴스.
+        local_search (LocalSearchConfig): 로컬 벡터 검색 설정 인스턴스.
+        profiling (ProfilingConfig): 요청 프로파일링 설정 인스턴스.
     """
 
     def __init__(self):
+        self.server = ServerConfig()
         self.mariadb = MariaDBConfig()
         self.milvus = MilvusConfig()
         self.embedding = EmbeddingConfig()
-        self.data = DataConfig()
\ No newline at end of file
+        self.ingest = IngestConfig()
+        self.data = DataConfig()
+        self.search = SearchConfig()
+        self.snapshot = SnapshotConfig()
+        self.local_search = LocalSearchConfig()
+        self.profiling = ProfilingConfig()
\ No newline at end of file
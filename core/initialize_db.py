@@ -3,7 +3,8 @@ from sqlalchemy import create_engine, text, Column, BigInteger, String, MetaData
 from sqlalchemy.engine import reflection
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
-from pymilvus import connections, Collection, FieldSchema, CollectionSchema, DataType, utility, db
+from sqlalchemy.ext.asyncio import create_async_engine
+from pymilvus import connections, Collection, FieldSchema, CollectionSchema, DataType, utility, db, AsyncMilvusClient
 from core.messages import ServerMessages
 
 logger = logging.getLogger("uvicorn.error")
@@ -22,6 +23,8 @@ class InitializeDB:
         engine (Engine): SQLAlchemy 엔진 객체.
         mariadb_connection (Connection): MariaDB 연결 객체.
         session (Session): SQLAlchemy 세션 팩토리.
+        async_engine (AsyncEngine): 검색 경로에서 사용하는 SQLAlchemy 비동기 엔진 객체.
+        async_milvus_client (AsyncMilvusClient): 검색 경로에서 사용하는 Milvus 비동기 클라이언트.
     """
 
     def __init__(self, config):
@@ -38,6 +41,8 @@ class InitializeDB:
         self.engine = None
         self.mariadb_connection = None
         self.session = None
+        self.async_engine = None
+        self.async_milvus_client = None
 
         # MariaDB 존재 여부 확인 및 생성
         try:
@@ -77,6 +82,21 @@ class InitializeDB:
         except Exception as e:
             logger.error(ServerMessages.DB_CONNECT_ERROR + f"{e}")
 
+        # MariaDB 비동기 엔진 생성 (검색 경로 전용 커넥션 풀)
+        try:
+            self.async_engine = create_async_engine(
+                f"mysql+aiomysql://{self.mariadb_config.user}:{self.mariadb_config.password}"
+                f"@{self.mariadb_config.host}:{self.mariadb_config.port}/{self.mariadb_config.database}",
+                pool_size=self.mariadb_config.async_pool_size,
+                max_overflow=self.mariadb_config.async_max_overflow,
+                pool_timeout=self.mariadb_config.pool_timeout,
+                pool_recycle=self.mariadb_config.pool_recycle,
+                pool_pre_ping=True
+            )
+            logger.info(ServerMessages.DB_ASYNC_CONNECT_SUCCESS)
+        except Exception as e:
+            logger.error(ServerMessages.DB_ASYNC_CONNECT_ERROR + f"{e}")
+
         # Milvus 연결 및 DB 존재 여부 확인/생성
         try:
             connections.connect(
@@ -135,6 +155,35 @@ class InitializeDB:
         logger.info(ServerMessages.DB_TABLE_CREATE_SUCCESS + f"{self.mariadb_config.table}")
 
 
+    def create_milvus_collection(self, collection_name: str):
+        """Milvus 컬렉션 하나와 인덱스를 생성하고 메모리에 로드합니다.
+
+        Args:
+            collection_name (str): 생성할 컬렉션 이름.
+
+        Returns:
+            Collection: 생성된 컬렉션 객체.
+        """
+        fields = [
+            FieldSchema(name="id", dtype=DataType.INT64, is_primary=True, auto_id=False),
+            FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=10000),
+            FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=self.milvus_config.dim)
+        ]
+
+        schema = CollectionSchema(fields=fields, description=f"{collection_name} collection")
+        collection = Collection(name=collection_name, schema=schema, shards_num=2)
+
+        index_params = {
+            "metric_type": "COSINE",
+            "index_type": "IVF_FLAT",
+            "params": {"nlist": 128}
+        }
+
+        collection.create_index(field_name="embedding", index_params=index_params)
+        collection.load()
+        return collection
+
+
     def create_milvus_collections(self):
         """Milvus에 필요한 컬렉션과 인덱스를 생성합니다.
 
@@ -148,24 +197,31 @@ class InitializeDB:
                 results.append(ServerMessages.MILVUS_COLLECTION_EXISTS + f"{collection_name}")
                 continue
 
-            fields = [
-                FieldSchema(name="id", dtype=DataType.INT64, is_primary=True, auto_id=False),
-                FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=10000),
-                FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=1024)
-            ]
+            self.create_milvus_collection(collection_name)
 
-            schema = CollectionSchema(fields=fields, description=f"{collection_name} collection")
-            collection = Collection(name=collection_name, schema=schema, shards_num=2)
+            results.append(ServerMessages.MILVUS_COLLECTION_CREATE_SUCCESS + f"{collection_name}")
 
-            index_params = {
-                "metric_type": "COSINE",
-                "index_type": "IVF_FLAT",
-                "params": {"nlist": 128}
-            }
+        logger.info("\n".join(results))
 
-            collection.create_index(field_name="embedding", index_params=index_params)
-            collection.load()
 
-            results.append(ServerMessages.MILVUS_COLLECTION_CREATE_SUCCESS + f"{collection_name}")
+    def create_async_milvus_client(self):
+        """검색 경로에서 사용할 Milvus 비동기 클라이언트를 생성합니다.
+
+        클라이언트가 이벤트 루프에 바인딩되므로 서버 시작 후 이벤트 루프 안에서 호출해야 합니다.
+        """
+        try:
+            self.async_milvus_client = AsyncMilvusClient(
+                uri=f"http://{self.milvus_config.host}:{self.milvus_config.port}",
+                db_name=self.milvus_config.database
+            )
+            logger.info(ServerMessages.MILVUS_ASYNC_CONNECT_SUCCESS)
+        except Exception as e:
+            logger.error(ServerMessages.MILVUS_ASYNC_CONNECT_ERROR + f"{e}")
+
 
-        logger.info("\n".join(results))
\ No newline at end of file
+    async def close_async_clients(self):
+        """MariaDB 비동기 엔진과 Milvus 비동기 클라이언트를 종료합니다."""
+        if self.async_milvus_client is not None:
+            await self.async_milvus_client.close()
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
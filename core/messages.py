@@ -20,6 +20,8 @@ class ServerMessages:
     DB_TABLE_EXISTS = "⚠️ 이미 존재하는 MariaDB 테이블: "
     DB_TABLE_CREATE_SUCCESS = "✅ MariaDB 테이블 생성 완료: "
     DB_COLUMN_CREATE_ERROR = "❌ 컬럼 생성 실패"
+    DB_ASYNC_CONNECT_SUCCESS = "✅ MariaDB 비동기 엔진 생성"
+    DB_ASYNC_CONNECT_ERROR = "❌ MariaDB 비동기 엔진 생성 실패"
 
     # Milvus 관련 메시지
     MILVUS_CONNECT_SUCCESS = "✅ Milvus 연결"
@@ -29,6 +31,8 @@ class ServerMessages:
     MILVUS_CREATE_ERROR = "❌ Milvus 데이터베이스 '{database}' 생성 실패"
     MILVUS_COLLECTION_EXISTS = "⚠️ 이미 존재하는 Milvus 컬렉션: "
     MILVUS_COLLECTION_CREATE_SUCCESS = "✅ Milvus 컬렉션 및 인덱스 생성 완료: "
+    MILVUS_ASYNC_CONNECT_SUCCESS = "✅ Milvus 비동기 클라이언트 연결"
+    MILVUS_ASYNC_CONNECT_ERROR = "❌ Milvus 비동기 클라이언트 연결 실패"
 
     # JSON 파일 처리 메시지
     JSON_LOAD_SUCCESS = "✅ Json 파일 로드"
@@ -41,6 +45,15 @@ class ServerMessages:
     DATA_INSERT_COMPLETE = "✅ 데이터 등록 완료"
     DATA_INSERT_ERROR = "❌ 데이터 등록 실패"
     DATA_INSERT_INFO = "✅ 총 데이터수: {len} 배치사이즈: {batch}"
+    DATA_DEAD_LETTER = "⚠️ 임베딩 실패 데이터 {count}건 기록: {path}"
+
+    # 데이터 갱신/삭제 메시지
+    DATA_UPSERT_START = "✅ 데이터 갱신 시작"
+    DATA_UPSERT_COMPLETE = "✅ 데이터 갱신 완료"
+    DATA_UPSERT_ERROR = "❌ 데이터 갱신 실패"
+    DATA_DELETE_START = "✅ 데이터 삭제 시작"
+    DATA_DELETE_COMPLETE = "✅ 데이터 삭제 완료"
+    DATA_DELETE_ERROR = "❌ 데이터 삭제 실패"
 
     # 개발용 임베딩 처리 메시지
     DEV_EMBEDDING_DB_LOAD_SUCCESS = "✅ MariaDB 데이터 로드"
@@ -49,7 +62,41 @@ class ServerMessages:
 
     # 임베딩 오류 메시지
     EMBEDDING_ERROR = "❌ 데이터 임베딩 실패"
+    EMBEDDING_MODEL_ERROR = "❌ 임베딩 모델 조회 실패"
+    EMBEDDING_COUNT_ERROR = "❌ 임베딩 결과 수 불일치 (요청: {expected}, 응답: {actual})"
+    EMBEDDING_RESPONSE_ERROR = "❌ 임베딩 응답 형식 오류: "
+    EMBEDDING_RETRY = "⚠️ 데이터 임베딩 재시도 ({attempt}/{max_retries}, {count}건): "
+    EMBEDDING_UNAVAILABLE = "❌ 임베딩 서버 오류가 계속되어 데이터 등록 중단: "
+    EMBEDDING_BISECT = "⚠️ 데이터 임베딩 배치 분할 재시도: {count}건"
+
+    # 임베딩 스냅샷 메시지
+    SNAPSHOT_EXPORT_START = "✅ 스냅샷 내보내기 시작: {collection}"
+    SNAPSHOT_EXPORT_COMPLETE = "✅ 스냅샷 내보내기 완료: {path}"
+    SNAPSHOT_EXPORT_ERROR = "❌ 스냅샷 내보내기 실패"
+    SNAPSHOT_RESTORE_START = "✅ 스냅샷 복원 시작: {path}"
+    SNAPSHOT_RESTORE_COMPLETE = "✅ 스냅샷 복원 완료: {collection}"
+    SNAPSHOT_RESTORE_ERROR = "❌ 스냅샷 복원 실패"
+    SNAPSHOT_PRUNE = "✅ 이전 스냅샷 정리: {collection} ({count}개)"
+    SNAPSHOT_PRUNE_ERROR = "❌ 이전 스냅샷 정리 실패"
+    SNAPSHOT_RENAME_ERROR = "❌ 스냅샷 복원 컬렉션 이름 변경 실패, 복원된 데이터는 임시 컬렉션에 남아 있음: {collection} "
+    SNAPSHOT_NOT_FOUND = "❌ 스냅샷을 찾을 수 없음: "
+    SNAPSHOT_VERSION_ERROR = "❌ 잘못된 스냅샷 버전: "
+    SNAPSHOT_COLLECTION_ERROR = "❌ 잘못된 컬렉션 이름: "
+    SNAPSHOT_INVALID = "❌ 스냅샷 검증 실패: "
 
     # 검색 오류 메시지
     MILVUS_SEARCH_ERROR = "❌ 밀버스 검색 실패"
-    MARIA_SEARCH_ERROR = "❌ MariaDB 검색 실패"
\ No newline at end of file
+    MARIA_SEARCH_ERROR = "❌ MariaDB 검색 실패"
+    SEARCH_FIELD_ERROR = "❌ 존재하지 않는 필드: "
+
+    # 로컬 벡터 검색 메시지
+    LOCAL_INDEX_LOAD_SUCCESS = "✅ 로컬 인덱스 로드: {collection} ({count}건)"
+    LOCAL_INDEX_LOAD_ERROR = "❌ 로컬 인덱스 로드 실패"
+    LOCAL_INDEX_STALE = "⚠️ 데이터 변경으로 로컬 인덱스를 대체 경로 전용으로 전환: "
+    LOCAL_SEARCH_FALLBACK = "⚠️ 밀버스 검색 실패로 로컬 인덱스 검색 사용: "
+
+    # 프로파일링 메시지
+    PROFILING_UNAVAILABLE = "⚠️ pyinstrument가 설치되어 있지 않아 요청 프로파일링을 사용할 수 없음"
+    PROFILING_CAPTURED = "✅ 요청 프로파일 저장: {path} ({profile_id})"
+    PROFILING_FORBIDDEN = "❌ 관리자 토큰이 필요합니다"
+    PROFILING_NOT_FOUND = "❌ 프로파일을 찾을 수 없음: "
\ No newline at end of file
@@ -0,0 +1,166 @@
+import hmac
+import time
+import random
+import logging
+from collections import deque
+from starlette.datastructures import Headers
+from snowflake import SnowflakeGenerator
+from core.messages import ServerMessages
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+except ImportError:
+    Profiler = None
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RequestProfiler:
+    """요청 단위 통계적 프로파일링을 수행하고 결과를 링 버퍼에 보관하는 클래스입니다.
+
+    설정된 비율로 요청을 샘플링하거나, 관리자 토큰과 프로파일 헤더가 함께 전달된 요청을 프로파일링합니다.
+    pyinstrument가 설치되어 있지 않거나 비활성화 상태이면 요청을 그대로 통과시킵니다.
+
+    Attributes:
+        config (AppConfig): 전체 애플리케이션 설정 객체.
+        profiling_config (ProfilingConfig): 프로파일링 설정 객체.
+        gen (SnowflakeGenerator): 프로파일 ID 생성을 위한 Snowflake ID 생성기.
+        profiles (deque): 최근 프로파일 결과를 보관하는 링 버퍼.
+    """
+
+    def __init__(self, config):
+        """RequestProfiler 클래스 초기화
+
+        Args:
+            config (AppConfig): 앱 설정 객체.
+        """
+        self.config = config
+        self.profiling_config = config.profiling
+        self.gen = SnowflakeGenerator(43)
+
+        self.profiles = deque(maxlen=self.profiling_config.max_profiles)
+
+        if self.profiling_config.enabled and Profiler is None:
+            logger.warning(ServerMessages.PROFILING_UNAVAILABLE)
+
+    def is_admin(self, headers):
+        """요청 헤더의 관리자 토큰이 설정값과 일치하는지 확인합니다.
+
+        Args:
+            headers (Headers): 요청 헤더.
+
+        Returns:
+            bool: 관리자 토큰이 설정되어 있고 일치하면 True.
+        """
+        admin_token = self.profiling_config.admin_token
+        token = headers.get(self.profiling_config.admin_header)
+        return admin_token is not None and token is not None and hmac.compare_digest(token.encode(), admin_token.encode())
+
+    def should_profile(self, path, headers):
+        """요청을 프로파일링할지 결정합니다.
+
+        Args:
+            path (str): 요청 경로.
+            headers (Headers): 요청 헤더.
+
+        Returns:
+            bool: 프로파일링 대상이면 True. exclude_paths에 해당하는 경로는 항상 False.
+        """
+        if any(path.startswith(prefix) for prefix in self.profiling_config.exclude_paths):
+            return False
+        if headers.get(self.profiling_config.profile_header) and self.is_admin(headers):
+            return True
+        return random.random() < self.profiling_config.sample_rate
+
+    def list_profiles(self):
+        """보관 중인 프로파일 목록을 반환합니다.
+
+        Returns:
+            list[dict]: 프로파일 ID, 요청 경로, 시작 시각, 소요 시간 목록.
+        """
+        return [{k: v for k, v in profile.items() if k != "session"} for profile in self.profiles]
+
+    def get_profile(self, profile_id: str):
+        """보관 중인 프로파일 세션을 찾습니다.
+
+        미들웨어가 이벤트 루프에서 링 버퍼에 추가하므로 이벤트 루프에서 호출해야 합니다.
+
+        Args:
+            profile_id (str): 프로파일 ID.
+
+        Returns:
+            Session or None: pyinstrument 세션, 프로파일이 없으면 None.
+        """
+        for profile in list(self.profiles):
+            if profile["id"] == profile_id:
+                return profile["session"]
+        return None
+
+    def render_profile(self, session, output_format: str = "speedscope"):
+        """프로파일 세션을 speedscope JSON 또는 HTML 플레임 그래프로 렌더링합니다.
+
+        Args:
+            session (Session): pyinstrument 세션.
+            output_format (str): "speedscope" 또는 "html".
+
+        Returns:
+            str: 렌더링 결과.
+        """
+        renderer = HTMLRenderer() if output_format == "html" else SpeedscopeRenderer()
+        return renderer.render(session)
+
+
+class ProfilingMiddleware:
+    """RequestProfiler를 요청 경로에 연결하는 ASGI 미들웨어입니다.
+
+    엔드포인트가 같은 태스크에서 실행되도록 순수 ASGI 미들웨어로 구현되어 있으며,
+    비활성화 상태에서는 설정값 확인 외의 추가 작업을 하지 않습니다.
+    """
+
+    def __init__(self, app, request_profiler):
+        """ProfilingMiddleware 초기화
+
+        Args:
+            app (ASGIApp): 감싸는 ASGI 애플리케이션.
+            request_profiler (RequestProfiler): 요청 프로파일러.
+        """
+        self.app = app
+        self.request_profiler = request_profiler
+
+    async def __call__(self, scope, receive, send):
+        profiler_config = self.request_profiler.profiling_config
+        if scope["type"] != "http" or not profiler_config.enabled or Profiler is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not self.request_profiler.should_profile(scope["path"], headers):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = str(next(self.request_profiler.gen))
+        is_admin = self.request_profiler.is_admin(headers)
+
+        # 프로파일 ID는 프로파일을 조회할 수 있는 관리자 요청에만 응답 헤더로 전달
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start" and is_admin:
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        profiler = Profiler(interval=profiler_config.interval, async_mode="enabled")
+        started_at = time.time()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            session = profiler.stop()
+            self.request_profiler.profiles.append({
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "started_at": started_at,
+                "duration": session.duration,
+                "session": session
+            })
+            logger.info(ServerMessages.PROFILING_CAPTURED.format(path=scope["path"], profile_id=profile_id))
@@ -1,14 +1,21 @@
 import logging
-from typing import List
-from fastapi import FastAPI, UploadFile, Body, File
+import httpx
+from typing import List, Optional
+from fastapi import FastAPI, UploadFile, Body, File, Request, HTTPException
+from fastapi.responses import Response, HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from anyio import to_thread
 from fastapi_mcp import FastApiMCP
 from core.config import AppConfig
 from core.messages import ServerMessages
 from core.initialize_db import InitializeDB
+from core.profiling import RequestProfiler, ProfilingMiddleware
 from api.get_info import GetInfo
 from api.insert_data import InsertData
 from api.vector_search import VectorSearch
+from api.embedding_snapshot import EmbeddingSnapshot
+from services.local_vector_index import LocalVectorIndex
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -19,8 +26,11 @@ app = FastAPI()
 config = AppConfig()
 initialize_db = InitializeDB(config)
 get_info = GetInfo(config)
-insert_data = InsertData(config, initialize_db)
-vector_search = VectorSearch(config, initialize_db)
+embedding_snapshot = EmbeddingSnapshot(config, initialize_db)
+local_index = LocalVectorIndex(config, embedding_snapshot)
+insert_data = InsertData(config, initialize_db, local_index)
+vector_search = VectorSearch(config, initialize_db, local_index)
+request_profiler = RequestProfiler(config)
 
 # CORS 설정: 개발 편의를 위해 모든 origin 허용
 app.add_middleware(
@@ -31,6 +41,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 프로파일링: 비활성화 시 요청을 그대로 통과
+app.add_middleware(ProfilingMiddleware, request_profiler=request_profiler)
+
 
 @app.on_event("startup")
 def startup_event():
@@ -38,9 +51,26 @@ def startup_event():
     logger.info(ServerMessages.INIT_START)
     initialize_db.create_mariadb_table()
     initialize_db.create_milvus_collections()
+    if config.local_search.enabled and config.local_search.preload:
+        for col in config.data.collection:
+            local_index.load(col)
     logger.info(ServerMessages.INIT_COMPLETE)
 
 
+@app.on_event("startup")
+async def startup_async_event():
+    """블로킹 작업용 스레드 풀 크기를 설정하고 검색 경로의 Milvus 비동기 클라이언트를 생성합니다."""
+    to_thread.current_default_thread_limiter().total_tokens = config.server.thread_pool_size
+    initialize_db.create_async_milvus_client()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 비동기 클라이언트를 정리합니다."""
+    await vector_search.aclose()
+    await initialize_db.close_async_clients()
+
+
 @app.get("/info", operation_id="get info")
 async def api_info():
     """서버 설정 정보 및 상태를 반환합니다.
@@ -48,7 +78,7 @@ async def api_info():
     Returns:
         dict: 서버 및 설정 정보.
     """
-    return get_info.get_server_info()
+    return await run_in_threadpool(get_info.get_server_info)
 
 
 @app.post("/insert_data", operation_id="insert data")
@@ -61,7 +91,35 @@ async def api_insert_data(file: UploadFile = File(...)):
     Returns:
         dict: 데이터 삽입 결과 정보.
     """
-    result = insert_data.data_insert(file)
+    result = await run_in_threadpool(insert_data.data_insert, file)
+    return result
+
+
+@app.post("/upsert_data", operation_id="upsert data")
+async def api_upsert_data(file: UploadFile = File(...)):
+    """업로드된 JSON 파일을 file_name 기준으로 DB 및 Milvus에 갱신 또는 삽입합니다.
+
+    Args:
+        file (UploadFile): 업로드된 JSON 파일.
+
+    Returns:
+        dict: 데이터 갱신 결과 정보.
+    """
+    result = await run_in_threadpool(insert_data.data_upsert, file)
+    return result
+
+
+@app.post("/delete_data", operation_id="delete data")
+async def api_delete_data(file_names: List[str] = Body(..., embed=True)):
+    """file_name 목록에 해당하는 데이터를 DB 및 Milvus에서 삭제합니다.
+
+    Args:
+        file_names (List[str]): 삭제할 file_name 목록.
+
+    Returns:
+        dict: 데이터 삭제 결과 정보.
+    """
+    result = await run_in_threadpool(insert_data.data_delete, file_names)
     return result
 
 
@@ -72,31 +130,145 @@ async def api_dev_embedding_insert_only():
     Returns:
         dict: 임베딩 삽입 결과 정보.
     """
-    result = insert_data.dev_embedding_insert_only()
+    result = await run_in_threadpool(insert_data.dev_embedding_insert_only)
     return result
 
 
-@app.post("/search", operation_id="search")
+@app.post("/export_snapshot", operation_id="export snapshot")
+async def api_export_snapshot(collection_names: str = Body(..., embed=True)):
+    """Milvus 컬렉션의 id 및 임베딩 벡터를 디스크 스냅샷으로 내보냅니다.
+
+    Args:
+        collection_names (str): 내보낼 Milvus 컬렉션 이름.
+
+    Returns:
+        dict: 스냅샷 내보내기 결과 정보.
+    """
+    result = await run_in_threadpool(embedding_snapshot.export_snapshot, collection_names)
+    return result
+
+
+@app.post("/restore_snapshot", operation_id="restore snapshot")
+async def api_restore_snapshot(
+    collection_names: str = Body(...),
+    version: Optional[str] = Body(None)
+):
+    """스냅샷을 재임베딩 없이 새 Milvus 컬렉션으로 복원합니다.
+
+    Args:
+        collection_names (str): 복원할 Milvus 컬렉션 이름.
+        version (Optional[str]): 복원할 스냅샷 버전. 기본값은 가장 최근 버전.
+
+    Returns:
+        dict: 스냅샷 복원 결과 정보.
+    """
+    local_index.invalidate(collection_names)
+    result = await run_in_threadpool(embedding_snapshot.restore_snapshot, collection_names, version)
+    return result
+
+
+@app.post("/sync_local_index", operation_id="sync local index")
+async def api_sync_local_index(collection_names: str = Body(..., embed=True)):
+    """Milvus 컬렉션을 스냅샷으로 내보낸 뒤 로컬 벡터 인덱스로 불러옵니다.
+
+    Args:
+        collection_names (str): 동기화할 Milvus 컬렉션 이름.
+
+    Returns:
+        dict: 로컬 인덱스 동기화 결과 정보.
+    """
+    result = await run_in_threadpool(local_index.sync, collection_names)
+    return result
+
+
+@app.get("/profiles", include_in_schema=False)
+async def api_profiles(request: Request):
+    """보관 중인 요청 프로파일 목록을 반환합니다. 관리자 토큰이 필요합니다.
+
+    Args:
+        request (Request): 관리자 토큰 헤더 확인용 요청 객체.
+
+    Returns:
+        list[dict]: 프로파일 ID, 요청 경로, 시작 시각, 소요 시간 목록.
+    """
+    if not request_profiler.is_admin(request.headers):
+        raise HTTPException(status_code=403, detail=ServerMessages.PROFILING_FORBIDDEN)
+    return request_profiler.list_profiles()
+
+
+@app.get("/profiles/{profile_id}", include_in_schema=False)
+async def api_profile(request: Request, profile_id: str, output_format: str = "speedscope"):
+    """요청 프로파일을 speedscope JSON 또는 HTML 플레임 그래프로 반환합니다. 관리자 토큰이 필요합니다.
+
+    Args:
+        request (Request): 관리자 토큰 헤더 확인용 요청 객체.
+        profile_id (str): 프로파일 ID.
+        output_format (str): "speedscope" 또는 "html". 기본값은 "speedscope".
+
+    Returns:
+        Response: 렌더링된 프로파일.
+    """
+    if not request_profiler.is_admin(request.headers):
+        raise HTTPException(status_code=403, detail=ServerMessages.PROFILING_FORBIDDEN)
+
+    session = request_profiler.get_profile(profile_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=ServerMessages.PROFILING_NOT_FOUND + f"{profile_id}")
+
+    rendered = await run_in_threadpool(request_profiler.render_profile, session, output_format)
+
+    if output_format == "html":
+        return HTMLResponse(rendered)
+    return Response(rendered, media_type="application/json")
+
+
+@app.post("/search", operation_id="search", response_class=ORJSONResponse)
 async def api_search(
+    request: Request,
     query: str = Body(...),
     collection_names: str = Body(...),
-    top_k: int = Body(1)
+    top_k: int = Body(1),
+    fields: Optional[List[str]] = Body(None),
+    compact: Optional[bool] = Body(None)
 ):
     """임베딩 벡터 기반 검색을 수행합니다.
 
     Args:
+        request (Request): MCP 도구 호출 여부 확인용 요청 객체.
         query (str): 검색할 쿼리 텍스트.
         collection_names (str): 검색할 Milvus 컬렉션 이름.
         top_k (int): 반환할 유사도 결과 개수. 기본값은 1.
+        fields (Optional[List[str]]): 반환할 컬럼 목록. 기본값은 전체 컬럼(MCP 호출 시 요약 컬럼).
+        compact (Optional[bool]): id와 score를 문자열로 반환하는 간결 모드. 기본값은 False(MCP 호출 시 True).
 
     Returns:
-        dict: 검색 결과 리스트.
+        ORJSONResponse: 검색 결과 리스트.
     """
-    return vector_search.only_vector(
+    if request.headers.get(config.search.mcp_header):
+        fields = config.search.mcp_fields if fields is None else fields
+        compact = True if compact is None else compact
+
+    invalid_fields = vector_search.invalid_fields(fields)
+    if invalid_fields:
+        raise HTTPException(status_code=400, detail=ServerMessages.SEARCH_FIELD_ERROR + f"{invalid_fields}")
+
+    result = await vector_search.only_vector(
         collection_names=collection_names,
         query_text=query,
-        top_k=top_k
+        top_k=top_k,
+        fields=fields,
+        compact=bool(compact)
     )
+    return ORJSONResponse(result)
 
-mcp = FastApiMCP(app)
+# MCP 도구 호출 요청에 헤더를 붙여 /search 가 간결한 응답을 기본으로 반환하도록 함
+mcp = FastApiMCP(
+    app,
+    http_client=httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://apiserver",
+        timeout=10.0,
+        headers={config.search.mcp_header: "1"}
+    )
+)
 mcp.mount()
\ No newline at end of file
@@ -0,0 +1,188 @@
+import logging
+import numpy as np
+from core.messages import ServerMessages
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class LocalVectorIndex:
+    """임베딩 스냅샷을 memory-map으로 불러와 프로세스 내에서 정확(brute-force) 검색을 수행하는 클래스입니다.
+
+    임베딩은 정규화(normalize=True)되어 저장되므로 내적을 COSINE 유사도로 사용합니다.
+    작은 컬렉션에서는 Milvus 대신 사용하는 빠른 경로로, Milvus 장애 시에는 대체 경로로 사용됩니다.
+    빠른 경로는 Milvus에서 방금 동기화한 인덱스에만 적용되며, 시작 시 불러온 이전 스냅샷이나
+    데이터 등록/갱신/삭제/복원 이후의 인덱스는 stale로 표시되어 장애 대체 경로로만 사용됩니다.
+
+    Attributes:
+        embedding_snapshot (EmbeddingSnapshot): 스냅샷 조회 및 내보내기 객체.
+        config (AppConfig): 전체 애플리케이션 설정 객체.
+        local_search_config (LocalSearchConfig): 로컬 검색 설정 객체.
+        indexes (dict): 컬렉션 이름을 키로 하는 (manifest, ids, embeddings) 튜플.
+        stale (set): Milvus와 내용이 다를 수 있어 빠른 경로에서 제외할 컬렉션 이름.
+        generations (dict): 컬렉션별 데이터 변경 횟수. 동기화 중 발생한 변경을 감지하는 데 사용.
+    """
+
+    def __init__(self, config, embedding_snapshot):
+        """LocalVectorIndex 클래스 초기화
+
+        Args:
+            config (AppConfig): 앱 설정 객체.
+            embedding_snapshot (EmbeddingSnapshot): 스냅샷 조회 및 내보내기 객체.
+        """
+        self.embedding_snapshot = embedding_snapshot
+
+        self.config = config
+        self.local_search_config = config.local_search
+
+        self.indexes = {}
+        self.stale = set()
+        self.generations = {}
+
+    def load(self, col: str, stale: bool = True):
+        """컬렉션의 최신 스냅샷을 memory-map으로 불러옵니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+            stale (bool): True이면 Milvus와 일치한다고 보장할 수 없으므로 장애 대체 경로로만 사용.
+
+        Returns:
+            bool: 불러오기에 성공하면 True, 스냅샷이 없거나 실패하면 False.
+        """
+        try:
+            path = self.embedding_snapshot.get_latest_snapshot(col)
+            if path is None:
+                logger.warning(ServerMessages.SNAPSHOT_NOT_FOUND + f"{col}")
+                return False
+
+            self.indexes[col] = self.embedding_snapshot.load_snapshot(path)
+            if stale:
+                self.stale.add(col)
+            else:
+                self.stale.discard(col)
+            logger.info(ServerMessages.LOCAL_INDEX_LOAD_SUCCESS.format(collection=col, count=len(self.indexes[col][1])))
+            return True
+        except Exception as e:
+            logger.error(ServerMessages.LOCAL_INDEX_LOAD_ERROR + f"{e}")
+            return False
+
+    def sync(self, col: str):
+        """Milvus에서 스냅샷을 새로 내보낸 뒤 로컬 인덱스로 불러오고 오래된 스냅샷을 정리합니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+
+        Returns:
+            dict: 동기화 성공 여부와 건수.
+        """
+        generation = self.generations.get(col, 0)
+        result = self.embedding_snapshot.export_snapshot(col)
+        if result["status"] != "success":
+            return result
+        # 내보내는 도중 데이터가 변경되었다면 스냅샷이 최신임을 보장할 수 없음
+        if not self.load(col, stale=self.generations.get(col, 0) != generation):
+            return {"status": "error", "detail": ServerMessages.LOCAL_INDEX_LOAD_ERROR}
+
+        # 동기화할 때마다 전체 스냅샷이 새로 생기므로 오래된 버전은 정리
+        try:
+            self.embedding_snapshot.prune_snapshots(col, self.config.snapshot.keep_versions)
+        except Exception as e:
+            logger.error(ServerMessages.SNAPSHOT_PRUNE_ERROR + f"{e}")
+        return {"status": "success", "version": result["version"], "count": result["count"]}
+
+    def invalidate(self, col: str):
+        """컬렉션 데이터가 변경되었음을 표시해 빠른 경로에서 제외합니다.
+
+        인덱스는 Milvus 장애 시 대체 경로로 계속 사용하며, sync 호출 시 다시 빠른 경로에 포함됩니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+        """
+        self.generations[col] = self.generations.get(col, 0) + 1
+        if col in self.indexes and col not in self.stale:
+            self.stale.add(col)
+            logger.info(ServerMessages.LOCAL_INDEX_STALE + f"{col}")
+
+    def has(self, col: str):
+        """컬렉션이 로컬 인덱스에 적재되어 있는지 확인합니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+
+        Returns:
+            bool: 적재되어 있으면 True.
+        """
+        return col in self.indexes
+
+    def is_fast_path(self, col: str):
+        """Milvus 대신 로컬 인덱스로 검색할 만큼 작은 컬렉션인지 확인합니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+
+        Returns:
+            bool: 로컬 검색이 활성화되어 있고, 인덱스가 최신이며, 건수가 fast_path_max_rows 이하이면 True.
+        """
+        return (
+            self.local_search_config.enabled
+            and self.has(col)
+            and col not in self.stale
+            and len(self.indexes[col][1]) <= self.local_search_config.fast_path_max_rows
+        )
+
+    def can_fallback(self, col: str):
+        """Milvus 검색 실패 시 로컬 인덱스로 대체할 수 있는지 확인합니다.
+
+        Args:
+            col (str): 컬렉션 이름.
+
+        Returns:
+            bool: 로컬 검색이 활성화되어 있고 인덱스가 적재되어 있으면 True. stale 인덱스도 포함.
+        """
+        return self.local_search_config.enabled and self.has(col)
+
+    def search(self, col: str, embedded_data: list, top_k: int):
+        """블록 단위 내적과 argpartition으로 top-k 정확 검색을 수행합니다.
+
+        Args:
+            col (str): 검색할 컬렉션 이름.
+            embedded_data (list): 쿼리 임베딩 벡터 리스트.
+            top_k (int): 반환할 유사 결과 수.
+
+        Returns:
+            list[list[tuple]]: 쿼리별 (id, score) 목록. score 내림차순.
+        """
+        _, ids, embeddings = self.indexes[col]
+
+        queries = np.asarray(embedded_data, dtype=np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        k = min(top_k, len(ids))
+        if k == 0:
+            return [[] for _ in queries]
+
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_index = np.empty((len(queries), 0), dtype=np.int64)
+
+        for start in range(0, len(ids), self.local_search_config.block_size):
+            block = embeddings[start:start + self.local_search_config.block_size]
+            scores = queries @ block.T
+
+            block_k = min(k, scores.shape[1])
+            part = np.argpartition(-scores, block_k - 1, axis=1)[:, :block_k]
+
+            best_scores = np.concatenate([best_scores, np.take_along_axis(scores, part, axis=1)], axis=1)
+            best_index = np.concatenate([best_index, part + start], axis=1)
+
+            # 블록마다 후보를 top-k로 줄여 메모리 사용량을 블록 크기로 제한
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_index = np.take_along_axis(best_index, keep, axis=1)
+
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_index = np.take_along_axis(best_index, order, axis=1)
+
+        return [
+            [(int(ids[i]), float(score)) for i, score in zip(index_row, score_row)]
+            for index_row, score_row in zip(best_index, best_scores)
+        ]
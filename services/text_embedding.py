@@ -1,3 +1,4 @@
+import httpx
 import requests
 from core.config import AppConfig
 from core.messages import ServerMessages
@@ -6,6 +7,10 @@ import logging
 logger = logging.getLogger("uvicorn.error")
 
 
+class EmbeddingCountError(ValueError):
+    """임베딩 서버가 요청한 텍스트 수와 다른 수의 벡터를 반환한 경우 발생하는 예외입니다."""
+
+
 class TextEmbeddings:
     """텍스트 임베딩 벡터를 생성하는 클래스입니다.
 
@@ -14,6 +19,8 @@ class TextEmbeddings:
     Attributes:
         config (AppConfig): 애플리케이션 설정을 담고 있는 객체.
         embed_url (str): 임베딩 요청을 보낼 API의 엔드포인트 URL.
+        info_url (str): 임베딩 모델 정보를 조회할 API의 엔드포인트 URL.
+        async_client (httpx.AsyncClient | None): 비동기 임베딩 요청용 HTTP 클라이언트.
     """
 
     def __init__(self):
@@ -23,19 +30,19 @@ class TextEmbeddings:
         """
         self.config = AppConfig()
         self.embed_url = f"http://{self.config.embedding.host}:{self.config.embedding.port}/embed"
+        self.info_url = f"http://{self.config.embedding.host}:{self.config.embedding.port}/info"
+        self.async_client = None
 
-    def get_embeddings(self, texts):
-        """입력된 텍스트 리스트에 대해 임베딩 벡터를 요청합니다.
+    def _build_payload(self, texts):
+        """임베딩 요청 본문을 생성합니다.
 
         Args:
             texts (List[str]): 임베딩을 생성할 텍스트 리스트.
 
         Returns:
-            dict or None: 정상적으로 처리되면 임베딩 결과를 포함한 JSON 딕셔너리,
-                          실패 시 None을 반환합니다.
+            dict: 임베딩 서버 요청 본문.
         """
-        headers = {"Content-Type": "application/json"}
-        data = {
+        return {
             "inputs": texts,
             "normalize": True,
             "prompt_name": None,
@@ -43,12 +50,75 @@ class TextEmbeddings:
             "truncation_direction": "Right"
         }
 
+    def request_embeddings(self, texts):
+        """입력된 텍스트 리스트에 대해 임베딩 벡터를 요청하고, 실패 시 예외를 발생시킵니다.
+
+        Args:
+            texts (List[str]): 임베딩을 생성할 텍스트 리스트.
+
+        Returns:
+            list: 텍스트 순서와 같은 임베딩 벡터 리스트.
+
+        Raises:
+            requests.RequestException: 임베딩 서버 요청이 실패한 경우.
+            TypeError: 응답이 벡터 리스트 형식이 아닌 경우.
+            EmbeddingCountError: 반환된 벡터 수가 텍스트 수와 다른 경우.
+        """
+        headers = {"Content-Type": "application/json"}
+        data = self._build_payload(texts)
+
+        response = requests.post(self.embed_url, headers=headers, json=data, timeout=self.config.embedding.timeout)
+        response.raise_for_status()
+        result = response.json()
+
+        if not isinstance(result, list):
+            raise TypeError(ServerMessages.EMBEDDING_RESPONSE_ERROR + f"{type(result).__name__}")
+        if len(result) != len(texts):
+            raise EmbeddingCountError(ServerMessages.EMBEDDING_COUNT_ERROR.format(expected=len(texts), actual=len(result)))
+        return result
+
+    async def aget_embeddings(self, texts):
+        """입력된 텍스트 리스트에 대해 비동기로 임베딩 벡터를 요청합니다.
+
+        Args:
+            texts (List[str]): 임베딩을 생성할 텍스트 리스트.
+
+        Returns:
+            dict or None: 정상적으로 처리되면 임베딩 결과를 포함한 JSON 딕셔너리,
+                          실패 시 None을 반환합니다.
+        """
+        if self.async_client is None:
+            self.async_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.config.embedding.max_connections),
+                timeout=self.config.embedding.timeout
+            )
+
         try:
-            response = requests.post(self.embed_url, headers=headers, json=data)
+            response = await self.async_client.post(self.embed_url, json=self._build_payload(texts))
             response.raise_for_status()
             result = response.json()
         except Exception as e:
             logger.error(ServerMessages.EMBEDDING_ERROR)
             return None
 
-        return result
\ No newline at end of file
+        return result
+
+    async def aclose(self):
+        """비동기 HTTP 클라이언트를 종료합니다."""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+
+    def get_model_id(self):
+        """임베딩 서버에서 사용 중인 모델 이름을 조회합니다.
+
+        Returns:
+            str or None: 모델 이름, 조회 실패 시 None을 반환합니다.
+        """
+        try:
+            response = requests.get(self.info_url, timeout=self.config.embedding.timeout)
+            response.raise_for_status()
+            return response.json()["model_id"]
+        except Exception as e:
+            logger.error(ServerMessages.EMBEDDING_MODEL_ERROR + f"{e}")
+            return None